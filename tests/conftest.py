@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Shared test helpers (importable without bpy).
+"""
+
+from unity_validator.core.base_checker import BaseChecker
+
+
+class StubObject(dict):
+    """Minimal stand-in for bpy.types.Object (custom properties via dict)."""
+    
+    def __init__(self, name, obj_type='MESH', **props):
+        super().__init__(**props)
+        self.name = name
+        self.type = obj_type
+
+
+class DummyChecker(BaseChecker):
+    name = "Dummy"
+    description = "Reports every object"
+    
+    def check(self, obj):
+        return [self.create_result(obj, "issue")]
\ No newline at end of file
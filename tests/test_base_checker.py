@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for BaseChecker.
+"""
+
+from conftest import DummyChecker, StubObject
+
+
+class CustomIdChecker(DummyChecker):
+    name = "Custom"
+    
+    def get_id(self):
+        return "my_custom"
+
+
+def test_default_id_strips_checker_suffix():
+    assert DummyChecker().get_id() == "dummy"
+
+
+def test_is_excluded_uses_default_id():
+    checker = DummyChecker()
+    assert checker.is_excluded(StubObject("A", unity_validator_exclude_dummy=True))
+    assert not checker.is_excluded(StubObject("B"))
+
+
+def test_is_excluded_honours_overridden_get_id():
+    checker = CustomIdChecker()
+    assert checker.is_excluded(StubObject("A", unity_validator_exclude_my_custom=True))
+    assert not checker.is_excluded(StubObject("B", unity_validator_exclude_custom=True))
+
+
+def test_is_excluded_respects_supports_exclusion():
+    checker = DummyChecker()
+    checker.supports_exclusion = False
+    assert not checker.is_excluded(StubObject("A", unity_validator_exclude_dummy=True))
+
+
+def test_check_batch_skips_unsupported_and_excluded():
+    objects = [
+        StubObject("Mesh"),
+        StubObject("Lamp", obj_type='LIGHT'),
+        StubObject("Skipped", unity_validator_exclude_dummy=True),
+        StubObject("Mesh.001"),
+    ]
+    results = DummyChecker().check_batch(objects)
+    assert [r.object_name for r in results] == ["Mesh", "Mesh.001"]
+
+
+def test_check_batch_matches_per_object_check():
+    checker = DummyChecker()
+    objects = [StubObject("A"), StubObject("B")]
+    expected = [r for obj in objects for r in checker.check(obj)]
+    assert checker.check_batch(objects) == expected
+
+
+def test_check_batch_empty():
+    assert DummyChecker().check_batch([]) == []
\ No newline at end of file
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for CheckerRegistry.
+"""
+
+import pytest
+
+from unity_validator.core.base_checker import BaseChecker
+from unity_validator.core.registry import CheckerRegistry, register_checker
+
+
+class AlphaChecker(BaseChecker):
+    name = "Alpha"
+    description = "First checker"
+    
+    def check(self, obj):
+        return []
+
+
+class BetaChecker(AlphaChecker):
+    name = "Beta"
+    description = "Second checker"
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    CheckerRegistry.clear()
+    yield
+    CheckerRegistry.clear()
+
+
+def test_register_decorator_returns_class():
+    assert register_checker(AlphaChecker) is AlphaChecker
+    assert CheckerRegistry.get_ids() == ["alpha"]
+    assert isinstance(CheckerRegistry.get("alpha"), AlphaChecker)
+
+
+def test_get_all_tracks_register_unregister_and_clear():
+    register_checker(AlphaChecker)
+    register_checker(BetaChecker)
+    assert [type(c) for c in CheckerRegistry.get_all()] == [AlphaChecker, BetaChecker]
+    
+    assert CheckerRegistry.unregister("alpha")
+    assert not CheckerRegistry.unregister("alpha")
+    assert [type(c) for c in CheckerRegistry.get_all()] == [BetaChecker]
+    
+    CheckerRegistry.clear()
+    assert CheckerRegistry.get_all() == ()
+    assert CheckerRegistry.count() == 0
+
+
+def test_get_all_returns_immutable_snapshot():
+    register_checker(AlphaChecker)
+    snapshot = CheckerRegistry.get_all()
+    assert isinstance(snapshot, tuple)
+    assert CheckerRegistry.get_all() is snapshot
+    
+    register_checker(BetaChecker)
+    assert len(snapshot) == 1
+    assert len(CheckerRegistry.get_all()) == 2
+
+
+class StubPreferences:
+    """Stand-in for addon preferences with enable_<checker_id> flags."""
+    
+    def __init__(self, **flags):
+        self.__dict__.update(flags)
+
+
+def test_get_enabled_filters_disabled_checkers():
+    register_checker(AlphaChecker)
+    register_checker(BetaChecker)
+    enabled = CheckerRegistry.get_enabled(StubPreferences(enable_alpha=False))
+    assert [c.get_id() for c in enabled] == ["beta"]
+
+
+def test_get_enabled_treats_missing_flags_as_enabled():
+    register_checker(AlphaChecker)
+    register_checker(BetaChecker)
+    enabled = CheckerRegistry.get_enabled(StubPreferences(enable_beta=True))
+    assert [c.get_id() for c in enabled] == ["alpha", "beta"]
+    assert CheckerRegistry.get_enabled(None) == CheckerRegistry.get_all()
\ No newline at end of file
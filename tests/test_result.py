@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for ValidationResult.
+"""
+
+import dataclasses
+
+import pytest
+
+from conftest import DummyChecker, StubObject
+from unity_validator.core.result import ValidationResult
+from unity_validator.core.severity import Severity
+
+
+def make_result(**kwargs):
+    return ValidationResult("Dummy", Severity.WARNING, "Cube", "issue", **kwargs)
+
+
+def test_empty_checker_name_or_message_rejected():
+    with pytest.raises(ValueError):
+        ValidationResult("", Severity.INFO, "Cube", "issue")
+    with pytest.raises(ValueError):
+        ValidationResult("Dummy", Severity.INFO, "Cube", "")
+
+
+def test_details_default_to_empty_dict():
+    assert make_result().details == {}
+
+
+def test_callable_details_resolved_on_first_access():
+    calls = []
+    
+    def build():
+        calls.append(1)
+        return {"faces": [1, 2]}
+    
+    result = make_result(details=build)
+    assert calls == []
+    assert result.details == {"faces": [1, 2]}
+    assert result.details is result.details
+    assert calls == [1]
+
+
+def test_create_result_passes_callable_details_through():
+    calls = []
+    
+    def build():
+        calls.append(1)
+        return {"faces": [3]}
+    
+    result = DummyChecker().create_result(StubObject("Cube"), "issue", details=build)
+    assert calls == []
+    assert result.details == {"faces": [3]}
+    assert calls == [1]
+
+
+def test_details_factory_merges_over_callable_details():
+    result = DummyChecker().create_result(
+        StubObject("Cube"), "issue",
+        details=lambda: {"uv": "UVMap", "count": 1},
+        details_factory=lambda: {"count": 3},
+    )
+    assert result.details == {"uv": "UVMap", "count": 3}
+
+
+def test_details_factory_visible_to_all_readers():
+    checker = DummyChecker()
+    result = checker.create_result(
+        StubObject("Cube"), "issue", details_factory=lambda: {"angle": 45.0}
+    )
+    assert "angle" in repr(result)
+    assert dataclasses.asdict(result)["details"] == {"angle": 45.0}
+    assert result.to_dict()["details"] == {"angle": 45.0}
+
+
+def test_details_factory_merges_without_mutating_caller_dict():
+    checker = DummyChecker()
+    base = {"uv": "UVMap"}
+    result = checker.create_result(
+        StubObject("Cube"), "issue", details=base, details_factory=lambda: {"count": 3}
+    )
+    assert result.details == {"uv": "UVMap", "count": 3}
+    assert base == {"uv": "UVMap"}
+
+
+def test_equality_stable_across_resolution():
+    checker = DummyChecker()
+    obj = StubObject("Cube")
+    r1 = checker.create_result(obj, "issue", details_factory=lambda: {"a": 1})
+    r2 = checker.create_result(obj, "issue", details_factory=lambda: {"a": 2})
+    assert r1 != r2
+    assert r1 == checker.create_result(obj, "issue", details={"a": 1})
+
+
+def test_fields_cannot_be_reassigned():
+    result = make_result()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.message = "changed"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.details = {}
+
+
+def test_results_deduplicate_in_sets():
+    first = make_result(details={"faces": [1]})
+    duplicate = make_result(details={"faces": [1]})
+    other = ValidationResult("Dummy", Severity.ERROR, "Cube", "issue")
+    assert hash(first) == hash(duplicate)
+    assert len({first, duplicate, other}) == 2
+
+
+def test_hash_ignores_unresolved_details():
+    lazy = make_result(details=lambda: {"faces": [1]})
+    assert hash(lazy) == hash(make_result(details={"faces": [1]}))
+    assert len({lazy, make_result(details={"faces": [1]})}) == 1
+
+
+def test_to_dict_returns_independent_dicts():
+    result = make_result(details={"faces": [1]}, fix_hint="Apply scale")
+    first = result.to_dict()
+    first["message"] = "mutated"
+    assert result.to_dict() == {
+        "checker_name": "Dummy",
+        "severity": "WARNING",
+        "object_name": "Cube",
+        "message": "issue",
+        "details": {"faces": [1]},
+        "fix_hint": "Apply scale",
+    }
+
+
+def test_asdict_contains_only_public_fields():
+    assert set(dataclasses.asdict(make_result())) == {
+        "checker_name", "severity", "object_name", "message", "details", "fix_hint",
+    }
\ No newline at end of file
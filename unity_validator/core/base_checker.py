@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Set, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import bpy
@@ -39,12 +39,26 @@ class BaseChecker(ABC):
     supported_types: Set[str] = {'MESH'}  # Object types this checker supports
     supports_exclusion: bool = True        # Can be excluded via custom property
     
+    # Default ID, resolved once per subclass in __init_subclass__
+    _id: str = ""
+    
+    def __init_subclass__(cls, **kwargs):
+        """Cache the default checker ID for the subclass."""
+        super().__init_subclass__(**kwargs)
+        class_name = cls.__name__
+        if class_name.endswith('Checker'):
+            class_name = class_name[:-7]
+        cls._id = class_name.lower()
+    
     def __init__(self):
         """Initialize the checker."""
         if not self.name:
             raise ValueError(f"{self.__class__.__name__} must define 'name'")
         if not self.description:
             raise ValueError(f"{self.__class__.__name__} must define 'description'")
+        
+        # Built from get_id() so subclasses overriding it stay consistent
+        self._exclude_prop = f"unity_validator_exclude_{self.get_id()}"
     
     @abstractmethod
     def check(self, obj: 'bpy.types.Object') -> List[ValidationResult]:
@@ -59,6 +73,32 @@ class BaseChecker(ABC):
         """
         pass
     
+    def check_batch(self, objects: Iterable['bpy.types.Object']) -> List[ValidationResult]:
+        """
+        Perform validation on multiple objects at once.
+        
+        Skips unsupported and excluded objects. The default implementation
+        calls `check` per object; subclasses can override this to share
+        work across the whole batch.
+        
+        Args:
+            objects: The Blender objects to validate
+            
+        Returns:
+            List of ValidationResult objects for all objects
+        """
+        # Bind once per batch instead of once per object
+        is_supported = self.is_supported
+        is_excluded = self.is_excluded
+        check = self.check
+        
+        results = []
+        extend = results.extend
+        for obj in objects:
+            if is_supported(obj) and not is_excluded(obj):
+                extend(check(obj))
+        return results
+    
     def is_supported(self, obj: 'bpy.types.Object') -> bool:
         """Check if this checker supports the given object type."""
         return obj.type in self.supported_types
@@ -72,8 +112,7 @@ class BaseChecker(ABC):
         if not self.supports_exclusion:
             return False
         
-        prop_name = f"unity_validator_exclude_{self.get_id()}"
-        return obj.get(prop_name, False)
+        return obj.get(self._exclude_prop, False)
     
     def get_id(self) -> str:
         """
@@ -81,18 +120,16 @@ class BaseChecker(ABC):
         
         Default: lowercase class name without 'Checker' suffix
         """
-        class_name = self.__class__.__name__
-        if class_name.endswith('Checker'):
-            class_name = class_name[:-7]
-        return class_name.lower()
+        return self._id
     
     def create_result(
         self,
         obj: 'bpy.types.Object',
         message: str,
         severity: Optional[Severity] = None,
-        details: Optional[dict] = None,
-        fix_hint: Optional[str] = None
+        details: Optional[Union[Dict[str, Any], Callable[[], Dict[str, Any]]]] = None,
+        fix_hint: Optional[str] = None,
+        details_factory: Optional[Callable[[], Dict[str, Any]]] = None
     ) -> ValidationResult:
         """
         Helper method to create a ValidationResult.
@@ -101,17 +138,32 @@ class BaseChecker(ABC):
             obj: The object with the issue
             message: Description of the issue
             severity: Override default severity (optional)
-            details: Additional data (optional)
+            details: Additional data, or a zero-argument callable building
+                it when the details are first read (optional)
             fix_hint: Suggestion for fixing (optional)
+            details_factory: Callable building extra data lazily; its
+                output is merged over `details` on first read (optional)
             
         Returns:
             ValidationResult instance
         """
+        if details_factory is not None:
+            base_details = details
+            
+            def build_details() -> Dict[str, Any]:
+                # Merge into a new dict so the caller's `details` is untouched
+                base = base_details() if callable(base_details) else base_details
+                return {**(base or {}), **details_factory()}
+            
+            result_details = build_details
+        else:
+            result_details = details or {}
+        
         return ValidationResult(
-            checker_name=self.name,
-            severity=severity or self.default_severity,
-            object_name=obj.name,
-            message=message,
-            details=details or {},
-            fix_hint=fix_hint
+            self.name,
+            severity or self.default_severity,
+            obj.name,
+            message,
+            result_details,
+            fix_hint,
         )
\ No newline at end of file
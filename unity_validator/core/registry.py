@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Dict, List, Type, Optional
+from typing import Dict, List, Tuple, Type, Optional
 import logging
 
 from .base_checker import BaseChecker
@@ -17,7 +17,7 @@ class CheckerRegistry:
     """
     
     _checkers: Dict[str, BaseChecker] = {}
-    _checker_classes: Dict[str, Type[BaseChecker]] = {}
+    _checkers_tuple: Tuple[BaseChecker, ...] = ()  # Snapshot for get_all()
     
     @classmethod
     def register(cls, checker_class: Type[BaseChecker]) -> Type[BaseChecker]:
@@ -38,7 +38,7 @@ class CheckerRegistry:
             logger.warning(f"Checker '{checker_id}' already registered, overwriting")
         
         cls._checkers[checker_id] = instance
-        cls._checker_classes[checker_id] = checker_class
+        cls._checkers_tuple = tuple(cls._checkers.values())
         
         logger.debug(f"Registered checker: {checker_id} ({checker_class.__name__})")
         return checker_class
@@ -56,7 +56,7 @@ class CheckerRegistry:
         """
         if checker_id in cls._checkers:
             del cls._checkers[checker_id]
-            del cls._checker_classes[checker_id]
+            cls._checkers_tuple = tuple(cls._checkers.values())
             return True
         return False
     
@@ -66,9 +66,29 @@ class CheckerRegistry:
         return cls._checkers.get(checker_id)
     
     @classmethod
-    def get_all(cls) -> List[BaseChecker]:
+    def get_all(cls) -> Tuple[BaseChecker, ...]:
         """Get all registered checker instances."""
-        return list(cls._checkers.values())
+        return cls._checkers_tuple
+    
+    @classmethod
+    def get_enabled(cls, prefs) -> Tuple[BaseChecker, ...]:
+        """
+        Get checker instances enabled in the given preferences.
+        
+        A checker is enabled unless `prefs` has an `enable_{checker_id}`
+        attribute set to False. Call once per validation run so disabled
+        checkers never enter the per-object loop.
+        
+        Args:
+            prefs: Addon preferences (or any object with enable_* attributes)
+            
+        Returns:
+            Tuple of enabled checker instances
+        """
+        return tuple(
+            checker for checker in cls._checkers_tuple
+            if getattr(prefs, f"enable_{checker.get_id()}", True)
+        )
     
     @classmethod
     def get_ids(cls) -> List[str]:
@@ -79,7 +99,7 @@ class CheckerRegistry:
     def clear(cls) -> None:
         """Clear all registered checkers."""
         cls._checkers.clear()
-        cls._checker_classes.clear()
+        cls._checkers_tuple = ()
     
     @classmethod
     def count(cls) -> int:
@@ -1,7 +1,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Callable, Optional, Dict, Any, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import bpy
@@ -9,24 +9,56 @@ if TYPE_CHECKING:
 from .severity import Severity
 
 
-@dataclass
+def _lazy_details(cls):
+    """
+    Replace the `details` slot of a slots dataclass with a resolving property.
+    
+    The slot still stores the value; a callable stored there is called on
+    first read and replaced by the dict it returns. Every reader (equality,
+    repr, dataclasses.asdict, to_dict) therefore sees the built details.
+    """
+    slot = cls.details
+    
+    def get_details(self) -> Dict[str, Any]:
+        value = slot.__get__(self, cls)
+        if callable(value):
+            value = dict(value())
+            slot.__set__(self, value)
+        return value
+    
+    cls.details = property(get_details, slot.__set__, doc=slot.__doc__)
+    return cls
+
+
+@_lazy_details
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """
     Represents a single validation result.
     
+    Fields cannot be reassigned after creation. Results hash on every field
+    except `details` and compare on all fields (lazy details are built
+    before comparing), so duplicates can be removed via sets. Do not mutate
+    the `details` dict of a result stored in a set.
+    
     Attributes:
         checker_name: Name of the checker that produced this result
         severity: Severity level of the issue
         object_name: Name of the affected object
         message: Human-readable description of the issue
-        details: Additional data (e.g., face indices, UV names)
+        details: Additional data (e.g., face indices, UV names). May be
+            given as a zero-argument callable returning a dict; it is called
+            on first access and `details` always reads as the built dict.
         fix_hint: Optional suggestion for fixing the issue
     """
     checker_name: str
     severity: Severity
     object_name: str
     message: str
-    details: Dict[str, Any] = field(default_factory=dict)
+    # Init accepts a dict or a builder; the `details` property always reads a dict
+    details: Union[Dict[str, Any], Callable[[], Dict[str, Any]]] = field(
+        default_factory=dict, hash=False
+    )
     fix_hint: Optional[str] = None
     
     def __post_init__(self):
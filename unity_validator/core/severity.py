@@ -3,6 +3,23 @@
 from enum import IntEnum, auto
 
 
+# Lookup tables indexed by severity value. auto() starts at 1, so index 0
+# is padding that keeps the tables aligned with the enum values.
+_ICONS = (
+    'QUESTION',
+    'INFO',
+    'ERROR',   # Blender's warning icon
+    'CANCEL',  # Blender's error icon
+)
+
+_COLORS = (
+    (0.5, 0.5, 0.5, 1.0),
+    (0.3, 0.6, 1.0, 1.0),  # Blue
+    (1.0, 0.8, 0.2, 1.0),  # Yellow
+    (1.0, 0.3, 0.3, 1.0),  # Red
+)
+
+
 class Severity(IntEnum):
     """
     Validation result severity levels.
@@ -17,19 +34,9 @@ class Severity(IntEnum):
     @property
     def icon(self) -> str:
         """Return Blender icon name for this severity."""
-        icons = {
-            Severity.INFO: 'INFO',
-            Severity.WARNING: 'ERROR',  # Blender's warning icon
-            Severity.ERROR: 'CANCEL',   # Blender's error icon
-        }
-        return icons.get(self, 'QUESTION')
+        return _ICONS[self]
     
     @property
     def color(self) -> tuple:
         """Return RGBA color for this severity."""
-        colors = {
-            Severity.INFO: (0.3, 0.6, 1.0, 1.0),     # Blue
-            Severity.WARNING: (1.0, 0.8, 0.2, 1.0),  # Yellow
-            Severity.ERROR: (1.0, 0.3, 0.3, 1.0),    # Red
-        }
-        return colors.get(self, (0.5, 0.5, 0.5, 1.0))
\ No newline at end of file
+        return _COLORS[self]
\ No newline at end of file
@@ -10,6 +10,10 @@ import bpy
 from typing import Tuple
 
 
+# The Blender version cannot change at runtime, so resolve it once
+_IS_4_1_OR_LATER = bpy.app.version >= (4, 1, 0)
+
+
 def get_blender_version() -> Tuple[int, int, int]:
     """Get the current Blender version as a tuple."""
     return bpy.app.version
@@ -17,7 +21,7 @@ def get_blender_version() -> Tuple[int, int, int]:
 
 def is_blender_4_1_or_later() -> bool:
     """Check if running Blender 4.1 or later."""
-    return bpy.app.version >= (4, 1, 0)
+    return _IS_4_1_OR_LATER
 
 
 def has_auto_smooth(mesh: 'bpy.types.Mesh') -> bool:
@@ -33,7 +37,7 @@ def has_auto_smooth(mesh: 'bpy.types.Mesh') -> bool:
     Returns:
         True if auto smooth (or equivalent) is enabled
     """
-    if is_blender_4_1_or_later():
+    if _IS_4_1_OR_LATER:
         # In 4.1+, auto smooth is replaced by custom normals
         return mesh.has_custom_normals
     else:
@@ -51,7 +55,7 @@ def get_auto_smooth_angle(mesh: 'bpy.types.Mesh') -> float:
     Returns:
         The auto smooth angle in radians, or 0.0 if not applicable
     """
-    if is_blender_4_1_or_later():
+    if _IS_4_1_OR_LATER:
         # In 4.1+, this is handled differently
         # TODO: Implement proper angle detection from custom normals
         return 0.523599  # Default 30 degrees in radians
@@ -21,9 +21,14 @@ def get_mesh_objects(
     Returns:
         List of mesh objects
     """
-    objects = []
+    if selected_only:
+        # Selected objects are always visible, so visible_get() is not needed
+        return [obj for obj in bpy.context.selected_objects if obj.type == 'MESH']
+    
+    # Objects outside the view layer are never visible
+    source = bpy.context.view_layer.objects if visible_only else bpy.data.objects
     
-    source = bpy.context.selected_objects if selected_only else bpy.data.objects
+    objects = []
     
     for obj in source:
         if obj.type != 'MESH':
@@ -63,7 +68,9 @@ def select_object(obj: bpy.types.Object, add: bool = False) -> None:
         add: If True, add to selection; if False, replace selection
     """
     if not add:
-        bpy.ops.object.select_all(action='DESELECT')
+        # Deselect directly instead of via bpy.ops to skip operator overhead
+        for selected in list(bpy.context.selected_objects):
+            selected.select_set(False)
     
     obj.select_set(True)
     bpy.context.view_layer.objects.active = obj
@@ -80,10 +87,9 @@ def focus_object(obj: bpy.types.Object) -> None:
     
     # Frame selected in all 3D views
     for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            for region in area.regions:
-                if region.type == 'WINDOW':
-                    override = {'area': area, 'region': region}
-                    with bpy.context.temp_override(**override):
-                        bpy.ops.view3d.view_selected()
-                    break
\ No newline at end of file
+        if area.type != 'VIEW_3D':
+            continue
+        region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+        if region is not None:
+            with bpy.context.temp_override(area=area, region=region):
+                bpy.ops.view3d.view_selected()
\ No newline at end of file